@@ -2,21 +2,38 @@
 
 import subprocess
 import platform
+import functools
 import sys
 import socket
-import requests
+import ipaddress
 import random
 import time
 import os
 import re
+import struct
+import statistics
 import json  # For saving settings
-import select
 import textwrap
-import traceback
 import argparse  # for command line arguments
-import ssl
+import threading
+import concurrent.futures
+import asyncio
 from datetime import datetime
 
+# Optional async HTTP support (pip install aiohttp): lets the list-servers
+# flow fetch every country over one pooled connection concurrently.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional in-process ICMP support (pip install icmplib): skips the fork+exec
+# of the ping binary per probe and gives precise RTTs without text parsing.
+try:
+    import icmplib
+except ImportError:
+    icmplib = None
+
 # ANSI color codes
 RESET = '\033[0m'
 RED = '\033[91m'
@@ -62,6 +79,10 @@ COLOR_PALETTES = {
     }
 }
 
+# Cheap import-time guard: every built-in palette must define the full color set
+assert all(set(palette) == {"RED", "GREEN", "YELLOW", "BLUE", "MAGENTA", "CYAN"}
+           for palette in COLOR_PALETTES.values()), "COLOR_PALETTES entry is missing a color"
+
 # ASCII art for "Random Pinger" in large red text
 ASCII_ART = f"""{COLOR_PALETTES["default"]["RED"]}
   __  __ _       _       ____  ____
@@ -82,6 +103,11 @@ SERVERS = {
     "microsoft": "microsoft.com"
 }
 
+# Cached views of the server table so menu loops don't rebuild lists per call;
+# tuples since SERVERS never changes at runtime.
+_SERVER_VALUES = tuple(SERVERS.values())
+_SERVER_ITEMS = tuple(SERVERS.items())
+
 # Default Settings and Settings File
 DEFAULT_SETTINGS = {
     "ping_count": 4,
@@ -94,6 +120,90 @@ SETTINGS_FILE = "pinger_settings.json"  # File to save settings
 # Version Information
 VERSION = "V1.4"  #Increment version number
 
+# Shared HTTP session so every lookup reuses pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per request. Created lazily so
+# `import requests` (tens of ms) isn't paid at startup by menu paths that
+# never touch HTTP; sys.modules makes later imports effectively free.
+SESSION = None
+
+def _get_session():
+    """Returns the shared HTTP session, importing requests on first use."""
+    global SESSION
+    if SESSION is None:
+        import requests
+        SESSION = requests.Session()
+        SESSION.headers["User-Agent"] = f"RandomPinger/{VERSION}"
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        SESSION.mount("http://", adapter)
+        SESSION.mount("https://", adapter)
+    return SESSION
+
+# OS details are detected once; platform.system() can be surprisingly costly
+# on some platforms and none of this changes while the script runs.
+_OS_NAME = platform.system().lower()
+_IS_WINDOWS = _OS_NAME == 'windows'
+_PING_COUNT_FLAG = '-n' if _IS_WINDOWS else '-c'
+_PLATFORM_LABEL = f"{platform.system()} {platform.release()}"
+_HOSTNAME = socket.gethostname()
+
+# Precompiled patterns for hot paths. The ping pattern matches raw bytes so
+# successful pings skip decoding the whole stdout buffer.
+_PING_RE = re.compile(rb'time=([\d.]+)\s?ms')
+_ANSI_RE = re.compile(r'^\033\[\d+m$')
+
+# One shared SSLContext for all TLS probes; creating a default context reloads
+# the system trust store and reconfigures ciphers every time. Created lazily
+# alongside the `import ssl` so startup doesn't pay for it.
+_SSL_CTX = None
+
+def _ssl_context():
+    """Returns the shared SSLContext, importing ssl on first use."""
+    global _SSL_CTX
+    if _SSL_CTX is None:
+        import ssl
+        _SSL_CTX = ssl.create_default_context()
+    return _SSL_CTX
+
+# Static device info, parsed once at import (Linux/Termux /proc files).
+def _read_proc_field(path, prefix, default):
+    """Returns the value of the first `prefix: value` line in a /proc file."""
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                if line.startswith(prefix):
+                    return line.split(":", 1)[1].strip()
+    except FileNotFoundError:
+        pass
+    return default
+
+_CPU_MODEL = _read_proc_field("/proc/cpuinfo", "model name", None)
+_MEM_TOTAL_KB = _read_proc_field("/proc/meminfo", "MemTotal", None)
+_TOTAL_MEMORY_GB = round(int(_MEM_TOTAL_KB.replace(" kB", "")) / 1024 / 1024, 2) if _MEM_TOTAL_KB else None
+
+# In-process DNS cache: hostname -> (ip, expiry timestamp). Repeated probes of
+# the same host within the TTL skip the resolver round trip entirely.
+_DNS_CACHE = {}
+_DNS_NEGATIVE_TTL = 60  # Retry failed resolutions sooner than good ones expire
+
+def _resolve(host, ttl=300):
+    """Resolves a hostname to an IP address, caching results for ttl seconds.
+
+    Failures are cached too (ip of None, shorter TTL) so a name that doesn't
+    resolve isn't re-queried by every probe in the same pass.
+    """
+    cached = _DNS_CACHE.get(host)
+    if cached and cached[1] > time.time():
+        if cached[0] is None:
+            raise socket.gaierror(f"cached DNS failure for '{host}'")
+        return cached[0]
+    try:
+        ip_address = socket.gethostbyname(host)
+    except socket.gaierror:
+        _DNS_CACHE[host] = (None, time.time() + _DNS_NEGATIVE_TTL)
+        raise
+    _DNS_CACHE[host] = (ip_address, time.time() + ttl)
+    return ip_address
+
 # Load Settings Function
 def load_settings():
     """Loads settings from the settings file or returns default settings."""
@@ -112,14 +222,72 @@ def load_settings():
         return DEFAULT_SETTINGS
 
 # Save Settings Function
+# Serialized form of the last write, used to skip redundant saves.
+_LAST_SAVED_SETTINGS = None
+
 def save_settings(settings):
-    """Saves settings to the settings file."""
+    """Saves settings to the settings file (atomic write via rename)."""
+    global _LAST_SAVED_SETTINGS
     try:
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(settings, f, indent=4)  # Save with indentation for readability
+        if os.environ.get("PINGER_PRETTY"):
+            data = json.dumps(settings, indent=4)  # Human-readable layout on request
+        else:
+            data = json.dumps(settings, separators=(',', ':'))  # Compact and fast
+        if data == _LAST_SAVED_SETTINGS:
+            return  # Nothing changed since the last write
+        tmp_file = SETTINGS_FILE + ".tmp"
+        with open(tmp_file, "w") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())  # On disk before the rename makes it visible
+        os.replace(tmp_file, SETTINGS_FILE)  # Atomic: never leaves a partial file
+        _LAST_SAVED_SETTINGS = data
     except Exception as e:
         print(f"{RED}Error saving settings: {e}{RESET}")
 
+# Pre-rendered menu text, rebuilt whenever the color theme changes so each
+# redraw is one cached write instead of re-assembling f-strings per render.
+_MAIN_MENU_STR = ""
+_SERVER_MENU_STR = ""
+_SETTINGS_MENU_STR = ""
+_DNS_MENU_STR = ""
+_PING_TWEAKS_MENU_TMPL = ""  # Has a {count} slot for the current ping count
+
+def _rebuild_menu_cache():
+    """Re-renders the cached menu blocks with the active color codes."""
+    global _MAIN_MENU_STR, _SERVER_MENU_STR, _SETTINGS_MENU_STR, _DNS_MENU_STR, _PING_TWEAKS_MENU_TMPL
+    _MAIN_MENU_STR = "\n".join((f"{BLUE}\nMain Menu:{RESET}",
+                                "  1. Ping a Predefined Server",
+                                "  2. Search for a Custom Hostname/IP",
+                                "  3. Randomly Ping a Server",
+                                "  4. List Available Servers with Status",
+                                "  5. Settings",
+                                "  6. Exit"))
+    server_lines = [f"{CYAN}\nAvailable Servers:{RESET}"]
+    server_lines.extend(f"  {i + 1}. {key} ({value})" for i, (key, value) in enumerate(_SERVER_ITEMS))
+    server_lines.append("\nEnter the number of the server you want to ping, or '0' to go back:")
+    _SERVER_MENU_STR = "\n".join(server_lines)
+    _SETTINGS_MENU_STR = "\n".join((f"{MAGENTA}\nSettings Menu:{RESET}",
+                                    "  1. Ping Connection Tweaks",
+                                    "  2. Show Device Specs",
+                                    "  3. Change Color Theme",
+                                    "  4. Wi-Fi Speed Test",
+                                    "  5. Version Info",
+                                    "  6. Resolve Hostname",
+                                    "  7. Analyze HTTP Headers",
+                                    "  8. Custom DNS Server",
+                                    "  9. Back to Main Menu"))
+    _DNS_MENU_STR = "\n".join((f"{CYAN}\nCustom DNS Server Settings:{RESET}",
+                               "  1. Set Primary DNS Server",
+                               "  2. Set Secondary DNS Server",
+                               "  3. View Current DNS Servers",
+                               "  4. Reset to Default DNS Servers",
+                               "  5. Back to Settings Menu"))
+    _PING_TWEAKS_MENU_TMPL = "\n".join((f"{CYAN}\nPing Connection Tweaks:{RESET}",
+                                        "  Current Ping Count: {count}",
+                                        "  1. Change Ping Count",
+                                        "  2. Back to Settings Menu"))
+
 # Function to apply the color theme
 def apply_color_theme(theme):
     """Applies a color theme based on the selected theme name."""
@@ -134,6 +302,7 @@ def apply_color_theme(theme):
         MAGENTA = palette["MAGENTA"]
         CYAN = palette["CYAN"]
         # RESET = '\033[0m' This does not need to be adjusted
+        _rebuild_menu_cache()  # Re-render the cached menus with the new colors
         print(f"{GREEN}Color theme set to {theme}.{RESET}")  # Confirm the them has been updated
     else:
         print(f"{RED}Invalid theme: {theme}. Using default.{RESET}")
@@ -144,11 +313,24 @@ SETTINGS = load_settings()
 PING_COUNT = SETTINGS["ping_count"]  # LOAD GLOBAL PING COUNT
 apply_color_theme(SETTINGS["color_theme"])  # Apply the color theme to the current color codes
 
+@functools.lru_cache(maxsize=256)
 def get_country(hostname):
-    """Gets the country of a hostname using the ipinfo.io API."""
+    """Gets the country of a hostname using the ipinfo.io API.
+
+    Results are memoized per hostname; geo data rarely changes, so listing
+    the servers repeatedly costs only one ipinfo.io round trip per host.
+    """
+    import requests
     try:
-        ip_address = socket.gethostbyname(hostname)  # Resolve hostname to IP
-        response = requests.get(f"https://ipinfo.io/{ip_address}/country")
+        # Literal IPs skip the resolver entirely; private/loopback addresses
+        # have no geo entry, so skip the ipinfo.io round trip too.
+        try:
+            ip = ipaddress.ip_address(hostname)
+        except ValueError:
+            ip = ipaddress.ip_address(_resolve(hostname))  # Resolve hostname to IP (cached)
+        if ip.is_private or ip.is_loopback or ip.is_link_local:
+            return "LAN"
+        response = _get_session().get(f"https://ipinfo.io/{ip}/country")
         if response.status_code == 200:
             return response.text.strip()
         else:
@@ -156,6 +338,51 @@ def get_country(hostname):
     except (socket.gaierror, requests.exceptions.RequestException):
         return "Unknown"
 
+def _icmp_checksum(data):
+    """Computes the RFC 1071 internet checksum of an ICMP packet."""
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(int.from_bytes(data[i:i + 2], 'big') for i in range(0, len(data), 2))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+def _icmp_ping(ip_address, count=1, timeout=1.0):
+    """Sends ICMP echo requests in-process over an unprivileged datagram socket.
+
+    Returns the mean RTT in milliseconds, or None if no replies arrived.
+    Raises PermissionError/OSError when ICMP datagram sockets are not allowed
+    (e.g. ping_group_range excludes us), so callers can fall back to the
+    ping binary.
+    """
+    import select
+    ident = os.getpid() & 0xFFFF
+    rtts = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP) as sock:
+        sock.setblocking(False)
+        for seq in range(count):
+            header = struct.pack('!BBHHH', 8, 0, 0, ident, seq)
+            payload = b'pinger' * 4
+            packet = struct.pack('!BBHHH', 8, 0, _icmp_checksum(header + payload), ident, seq) + payload
+            start = time.perf_counter()
+            sock.sendto(packet, (ip_address, 0))
+            deadline = start + timeout
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                if not select.select([sock], [], [], remaining)[0]:
+                    break
+                data, _ = sock.recvfrom(1024)
+                # With SOCK_DGRAM the kernel strips the IP header and rewrites
+                # the identifier, so match on echo-reply type and sequence.
+                if len(data) >= 8 and data[0] == 0 and struct.unpack('!H', data[6:8])[0] == seq:
+                    rtts.append((time.perf_counter() - start) * 1000.0)
+                    break
+    if rtts:
+        return statistics.fmean(rtts)
+    return None
+
 def ping(hostname, count=4):
     """
     Pings a host and returns the average ping time in milliseconds.
@@ -168,8 +395,39 @@ def ping(hostname, count=4):
         float: The average ping time in milliseconds, or None if the ping fails.
     """
 
-    param = '-n' if platform.system().lower() == 'windows' else '-c'
-    command = ['ping', param, str(count), hostname]
+    # Prefer in-process ICMP when icmplib is installed; fall back to the ping
+    # binary if unprivileged ICMP sockets are not permitted on this system.
+    if icmplib is not None:
+        try:
+            host = icmplib.ping(hostname, count=count, timeout=2, privileged=False)
+            if host.packets_received:
+                return host.avg_rtt
+            return None
+        except icmplib.SocketPermissionError:
+            pass  # Unprivileged ICMP not allowed; use the ping binary below.
+        except icmplib.ICMPLibError:
+            return None
+    else:
+        # No icmplib: try the in-process ICMP implementation before paying
+        # for a fork+exec of the ping binary.
+        try:
+            ip_address = _resolve(hostname)
+        except socket.gaierror:
+            return None
+        try:
+            return _icmp_ping(ip_address, count=count, timeout=2)
+        except OSError:
+            pass  # ICMP datagram sockets unavailable; use the ping binary below.
+
+    command = ['ping', _PING_COUNT_FLAG, str(count), hostname]
+    if _IS_WINDOWS:
+        # Cap each reply wait at 1000 ms
+        tuned_command = ['ping', '-n', str(count), '-w', '1000', hostname]
+    else:
+        # 0.2 s between packets and a 1 s per-reply wait: a 4-packet ping
+        # finishes in well under a second instead of ~3 s at the default
+        # 1 s interval
+        tuned_command = ['ping', _PING_COUNT_FLAG, str(count), '-i', '0.2', '-W', '1', hostname]
 
     try:
         # Check if custom DNS is set and apply it if on Linux/Termux (more complex for Windows/macOS)
@@ -177,31 +435,41 @@ def ping(hostname, count=4):
         # For a user-level Python script, direct DNS server usage for `socket.gethostbyname` is not straightforward.
         # This implementation primarily influences how *this script* resolves hostnames if it were to use socket.gethostbyname directly.
         # For the `ping` command itself, system DNS settings are usually respected.
-        if platform.system().lower() in ['linux', 'darwin'] and (SETTINGS.get("primary_dns") or SETTINGS.get("secondary_dns")):
+        if _OS_NAME in ['linux', 'darwin'] and (SETTINGS.get("primary_dns") or SETTINGS.get("secondary_dns")):
             # This part is illustrative. Actually forcing `ping` to use specific DNS requires deeper OS integration
             # or pre-configuring `/etc/resolv.conf` (which needs root).
             # For `socket.gethostbyname`, we could use `dnspython` library for custom resolvers.
             pass # We'll rely on the OS's DNS settings for the ping command for simplicity.
 
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = process.communicate()
+        # Hard timeout so a hung ping can't stall the UI indefinitely
+        result = subprocess.run(tuned_command, capture_output=True, timeout=count + 5)
+        if result.returncode != 0:
+            # Some ping builds reject the tuned flags (e.g. sub-second -i
+            # without root); retry with the stock invocation.
+            result = subprocess.run(command, capture_output=True, timeout=count + 5)
 
-        if process.returncode == 0:
-            output = stdout.decode()
-            # Regex to extract ping times from each line
-            ping_times = re.findall(r'time=([\d.]+)\s?ms', output)
+        if result.returncode == 0:
+            if count == 1:
+                # Single-probe fast path (the shape every status display uses):
+                # stop at the first match, no list or averaging needed.
+                match = _PING_RE.search(result.stdout)
+                return float(match.group(1)) if match else None
+
+            # Extract ping times from the raw output
+            ping_times = _PING_RE.findall(result.stdout)
 
             if ping_times:
-                ping_times = [float(time) for time in ping_times]
-                avg_ping_time = sum(ping_times) / len(ping_times)
-                return avg_ping_time
+                return statistics.fmean(map(float, ping_times))
             else:
                 return None  # No ping times found in output
         else:
-            print(f"Ping failed with error code: {process.returncode}")
-            print(stderr.decode())
+            print(f"Ping failed with error code: {result.returncode}")
+            print(result.stderr.decode())
             return None
 
+    except subprocess.TimeoutExpired:
+        print(f"Ping to {hostname} timed out.")
+        return None
     except OSError as e:
         print(f"Error executing ping command: {e}")
         return None
@@ -210,9 +478,13 @@ def ping(hostname, count=4):
         return None
 
 
-def get_certificate_info(hostname):
-    """Retrieves certificate information from a server."""
-    context = ssl.create_default_context()
+def get_tls_info(hostname):
+    """Retrieves certificate information and TLS version over a single handshake.
+
+    Returns a (cert, encryption_type) tuple; cert is None when the handshake
+    fails and encryption_type then describes the failure.
+    """
+    import ssl
     try:
         # Use custom DNS if available for name resolution before connecting
         # Note: For this to truly use custom DNS, you'd typically need to
@@ -220,16 +492,22 @@ def get_certificate_info(hostname):
         # to IP using `socket.gethostbyname` if system-wide DNS is modified.
         # Here, `socket.create_connection` relies on system DNS, but if a custom
         # DNS is configured *system-wide*, it will be used.
-        with socket.create_connection((hostname, 443), timeout=5) as sock:  # HTTPS port
-            with context.wrap_socket(sock, server_hostname=hostname) as ssocket:
-                cert = ssocket.getpeercert()
-                return cert
+        # Connect to the cached IP but keep server_hostname so SNI and
+        # certificate validation still use the real hostname.
+        with socket.create_connection((_resolve(hostname), 443), timeout=5) as sock:  # HTTPS port
+            with _ssl_context().wrap_socket(sock, server_hostname=hostname) as ssocket:
+                return ssocket.getpeercert(), ssocket.version()
     except socket.gaierror:
         print(f"{RED}Could not resolve hostname '{hostname}'.{RESET}")
-        return None
-    except (socket.timeout, ssl.SSLError, OSError) as e:
+        return None, "Unknown - Could not resolve hostname"
+    except ssl.SSLError as e:
         print(f"{RED}Failed to retrieve certificate for {hostname}: {e}{RESET}")
-        return None
+        if "PROTOCOL_NOT_SUPPORTED" in str(e):
+            return None, "None - Server does not support SSL/TLS"
+        return None, f"Unknown - SSL Error: {e}"
+    except (socket.timeout, OSError) as e:
+        print(f"{RED}Failed to retrieve certificate for {hostname}: {e}{RESET}")
+        return None, f"Unknown - OS Error: {e}"
 
 
 def calculate_certificate_lifetime(cert):
@@ -258,31 +536,113 @@ def get_certificate_name(cert):
     except KeyError:
         return "Unknown"
 
-def get_encryption_type(hostname):
-    """Determines the encryption type used by a server (TLS version)."""
-    try:
-        context = ssl.create_default_context()
-        with socket.create_connection((hostname, 443), timeout=5) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as ssocket:
-                return ssocket.version()
-    except socket.gaierror:
-        return "Unknown - Could not resolve hostname"
-    except ssl.SSLError as e:
-        if "PROTOCOL_NOT_SUPPORTED" in str(e):
-            return "None - Server does not support SSL/TLS"
-        return f"Unknown - SSL Error: {e}"
-    except OSError as e:
-        return f"Unknown - OS Error: {e}"
-    except Exception as e:
-        return f"Unknown - Error: {e}"
+# Keeps each server's status block contiguous when probes run on worker threads.
+_PRINT_LOCK = threading.Lock()
+
+def _probe_server(hostname, executor):
+    """Submits the three network probes for a host and returns their futures."""
+    return (executor.submit(get_country, hostname),
+            executor.submit(ping, hostname, 1),
+            executor.submit(get_tls_info, hostname))
 
 def display_server_status(hostname):
     """Displays the status of a given server with color, country, ping time, certificate info, and encryption type."""
-    country = get_country(hostname)
-    avg_ping_time = ping(hostname, count=1)  # Get the ping time
-    cert = get_certificate_info(hostname)
-    encryption_type = get_encryption_type(hostname)
+    # The probes are independent network calls, so overlap them instead of
+    # paying their latencies back to back.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        country_future, ping_future, tls_future = _probe_server(hostname, executor)
+        cert, encryption_type = tls_future.result()
+        _print_server_status(hostname, country_future.result(), ping_future.result(), cert, encryption_type)
+
+def get_countries(hostnames):
+    """Fetches countries for many hostnames in one ipinfo.io /batch request.
+
+    Returns a {hostname: country} dict, or None if the batch call fails so
+    callers can fall back to per-host lookups.
+    """
+    import requests
+    ips = {}
+    countries = {}
+    for hostname in hostnames:
+        try:
+            try:
+                ip = ipaddress.ip_address(hostname)
+            except ValueError:
+                ip = ipaddress.ip_address(_resolve(hostname))
+        except socket.gaierror:
+            countries[hostname] = "Unknown"
+            continue
+        if ip.is_private or ip.is_loopback or ip.is_link_local:
+            countries[hostname] = "LAN"  # No geo entry for private ranges
+        else:
+            ips[hostname] = str(ip)
+    if not ips:
+        return countries
+    try:
+        response = _get_session().post("https://ipinfo.io/batch",
+                                       json=[f"{ip}/country" for ip in ips.values()], timeout=5)
+        if response.status_code != 200:
+            return None
+        results = response.json()
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+    for hostname, ip in ips.items():
+        value = results.get(f"{ip}/country")
+        countries[hostname] = value.strip() if isinstance(value, str) else "Unknown"
+    return countries
+
+async def _gather_countries(hostnames):
+    """Fetches the country of every hostname concurrently over one aiohttp session."""
+    async def fetch(session, hostname):
+        try:
+            ip_address = _resolve(hostname)
+        except socket.gaierror:
+            return "Unknown"
+        try:
+            async with session.get(f"https://ipinfo.io/{ip_address}/country") as response:
+                if response.status == 200:
+                    return (await response.text()).strip()
+                return "Unknown"
+        except aiohttp.ClientError:
+            return "Unknown"
+
+    connector = aiohttp.TCPConnector(limit=16)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        countries = await asyncio.gather(*(fetch(session, hostname) for hostname in hostnames))
+    return dict(zip(hostnames, countries))
 
+def _fetch_countries(hostnames):
+    """Fetches all countries in one async pass, or returns None to use the sync path."""
+    if aiohttp is None:
+        return None
+    try:
+        return asyncio.run(_gather_countries(list(hostnames)))
+    except Exception:
+        return None  # Fall back to per-host sync lookups
+
+def list_servers_status():
+    """Displays the status of every predefined server, probing them in parallel."""
+    # Prefer one /batch round trip for all countries; failing that, the
+    # aiohttp concurrent pass; failing that, per-host lookup futures.
+    countries = get_countries(_SERVER_VALUES)
+    if countries is None:
+        countries = _fetch_countries(_SERVER_VALUES)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        # Submit every probe for every host up front so all the network I/O
+        # overlaps; wall time drops to roughly the slowest single probe.
+        probes = []
+        for hostname in _SERVER_VALUES:
+            country_future = executor.submit(get_country, hostname) if countries is None else None
+            probes.append((hostname, country_future,
+                           executor.submit(ping, hostname, 1),
+                           executor.submit(get_tls_info, hostname)))
+        for hostname, country_future, ping_future, tls_future in probes:
+            country = countries[hostname] if countries is not None else country_future.result()
+            cert, encryption_type = tls_future.result()
+            _print_server_status(hostname, country, ping_future.result(), cert, encryption_type)
+
+def _print_server_status(hostname, country, avg_ping_time, cert, encryption_type):
+    """Prints the assembled status block for one server."""
     if avg_ping_time is not None:
         status_color = GREEN
         status_text = f"Available - Ping: {avg_ping_time:.2f} ms"
@@ -290,36 +650,32 @@ def display_server_status(hostname):
         status_color = RED
         status_text = "Unavailable"
 
-    print(f"  - {hostname} ({country}) - {status_color}{status_text}{RESET}")
+    with _PRINT_LOCK:
+        print(f"  - {hostname} ({country}) - {status_color}{status_text}{RESET}")
 
-    if cert:
-        cert_name = get_certificate_name(cert)
-        print(f"    {GREEN}Certificate Name: {cert_name}{RESET}")
+        if cert:
+            cert_name = get_certificate_name(cert)
+            print(f"    {GREEN}Certificate Name: {cert_name}{RESET}")
 
-        lifetime = calculate_certificate_lifetime(cert)
-        if lifetime:
-            print(f"    {GREEN}Certificate Lifetime: {lifetime}{RESET}")
+            lifetime = calculate_certificate_lifetime(cert)
+            if lifetime:
+                print(f"    {GREEN}Certificate Lifetime: {lifetime}{RESET}")
+            else:
+                print(f"    {YELLOW}Could not determine certificate lifetime.{RESET}")
         else:
-            print(f"    {YELLOW}Could not determine certificate lifetime.{RESET}")
-    else:
-        print(f"    {YELLOW}Could not retrieve certificate information.{RESET}")
+            print(f"    {YELLOW}Could not retrieve certificate information.{RESET}")
 
-    print(f"    {CYAN}Encryption Type: {encryption_type}{RESET}")
+        print(f"    {CYAN}Encryption Type: {encryption_type}{RESET}")
 
 def display_main_menu():
     """Displays the main menu with options."""
-    print(f"{BLUE}\nMain Menu:{RESET}")
-    print("  1. Ping a Predefined Server")
-    print("  2. Search for a Custom Hostname/IP")
-    print("  3. Randomly Ping a Server")
-    print("  4. List Available Servers with Status")
-    print("  5. Settings")
-    print("  6. Exit")
+    print(_MAIN_MENU_STR)
 
 def get_main_menu_choice():
     """Gets the user's choice from the main menu."""
+    # Print the menu once per visit; invalid input just re-prompts
+    display_main_menu()
     while True:
-        display_main_menu()
         choice = input("> ")
         if choice in ("1", "2", "3", "4", "5", "6"):
             return choice
@@ -328,22 +684,19 @@ def get_main_menu_choice():
 
 def display_server_menu():
     """Displays the server menu."""
-    print(f"{CYAN}\nAvailable Servers:{RESET}")
-    for i, (key, value) in enumerate(SERVERS.items()):
-        print(f"  {i + 1}. {key} ({value})")
-    print("\nEnter the number of the server you want to ping, or '0' to go back:")
+    print(_SERVER_MENU_STR)
 
 def get_server_menu_choice():
     """Gets the user's choice from the server menu."""
+    display_server_menu()
     while True:
-        display_server_menu()
         choice = input("> ")
         if choice == '0':
             return None  # Go back to main menu
         try:
             choice_index = int(choice) - 1
             if 0 <= choice_index < len(SERVERS):
-                return list(SERVERS.values())[choice_index]
+                return _SERVER_VALUES[choice_index]
             else:
                 print("Invalid server number. Please try again.")
         except ValueError:
@@ -351,7 +704,7 @@ def get_server_menu_choice():
 
 def random_ping():
     """Randomly pings a server from the list."""
-    hostname = random.choice(list(SERVERS.values()))
+    hostname = random.choice(_SERVER_VALUES)
     print(f"{YELLOW}Randomly selected: {hostname}{RESET}")
     display_server_status(hostname)  # Show the status of the randomly selected server
 
@@ -364,33 +717,27 @@ def random_ping():
 
 def analyze_http_headers(hostname):
     """Retrieves and analyzes HTTP headers from a given hostname."""
+    import requests
     try:
-        response = requests.get(f"http://{hostname}", timeout=5, allow_redirects=True)
+        response = _get_session().get(f"http://{hostname}", timeout=5, allow_redirects=True)
         headers = response.headers
-        print(f"{GREEN}\n--- HTTP Headers for {hostname} ---{RESET}")
-        for key, value in headers.items():
-            print(f"  {key}: {value}")
-        print(f"  Status Code: {response.status_code}")
+        # Assemble the report and print it in one call; a single write beats
+        # per-line stdout locking and flushing on slow terminals.
+        lines = [f"{GREEN}\n--- HTTP Headers for {hostname} ---{RESET}"]
+        lines.extend(f"  {key}: {value}" for key, value in headers.items())
+        lines.append(f"  Status Code: {response.status_code}")
+        print("\n".join(lines))
     except requests.exceptions.RequestException as e:
         print(f"{RED}Failed to retrieve HTTP headers for {hostname}: {e}{RESET}")
 
 def display_settings_menu():
     """Displays the settings menu."""
-    print(f"{MAGENTA}\nSettings Menu:{RESET}")
-    print("  1. Ping Connection Tweaks")
-    print("  2. Show Device Specs")
-    print("  3. Change Color Theme")  # Added color theme setting
-    print("  4. Wi-Fi Speed Test")  # add speed test
-    print("  5. Version Info")
-    print("  6. Resolve Hostname")  # added resolve hostname
-    print("  7. Analyze HTTP Headers")  #New Analysis
-    print("  8. Custom DNS Server") #add custom dns
-    print("  9. Back to Main Menu")
+    print(_SETTINGS_MENU_STR)
 
 def get_settings_menu_choice():
     """Gets the user's choice from the settings menu."""
+    display_settings_menu()
     while True:
-        display_settings_menu()
         choice = input("> ")
         if choice in ("1", "2", "3", "4", "5", "6", "7", "8", "9"):  # added 5
             return choice
@@ -399,18 +746,13 @@ def get_settings_menu_choice():
 
 def display_custom_dns_menu():
     """Displays the Custom DNS Server menu."""
-    print(f"{CYAN}\nCustom DNS Server Settings:{RESET}")
-    print("  1. Set Primary DNS Server")
-    print("  2. Set Secondary DNS Server")
-    print("  3. View Current DNS Servers")  #Display them
-    print("  4. Reset to Default DNS Servers")
-    print("  5. Back to Settings Menu")
+    print(_DNS_MENU_STR)
 
 def get_custom_dns_menu_choice():
     """Gets the user's choice from the Custom DNS Server menu."""
     global SETTINGS
+    display_custom_dns_menu()
     while True:
-        display_custom_dns_menu()
         choice = input("> ")
         if choice in ("1", "2", "3", "4", "5"):
             return choice
@@ -453,16 +795,14 @@ def reset_default_dns_servers():
 
 def display_ping_tweaks_menu():
     """Displays the Ping Tweaks menu."""
-    print(f"{CYAN}\nPing Connection Tweaks:{RESET}")
-    print(f"  Current Ping Count: {SETTINGS['ping_count']}")
-    print("  1. Change Ping Count")
-    print("  2. Back to Settings Menu")
+    # The ping count is the only dynamic part; the rest is pre-rendered
+    print(_PING_TWEAKS_MENU_TMPL.format(count=SETTINGS['ping_count']))
 
 def get_ping_tweaks_menu_choice():
     """Gets the user's choice from the ping tweaks menu."""
     global SETTINGS  # Access the global settings
+    display_ping_tweaks_menu()
     while True:
-        display_ping_tweaks_menu()
         choice = input("> ")
         if choice == "1":
             while True:
@@ -484,69 +824,111 @@ def get_ping_tweaks_menu_choice():
 
 def show_device_specs():
     """Displays device specifications, live RAM and CPU usage."""
+    import select
+    try:
+        import termios
+        import tty
+    except ImportError:
+        termios = None  # Not a POSIX tty (e.g. Windows); fall back to line input
+
+    # Read usage straight from /proc instead of shelling out to top/free,
+    # which forked several processes per 0.5 s refresh.
+    def read_cpu_times():
+        """Reads (idle, total) jiffy counts from the first line of /proc/stat."""
+        try:
+            with open("/proc/stat", "r") as f:
+                fields = [float(value) for value in f.readline().split()[1:]]
+            return fields[3], sum(fields)
+        except (FileNotFoundError, IndexError, ValueError):
+            return None
+
+    prev_cpu_times = read_cpu_times()
 
     def get_cpu_usage():
-        """Gets CPU usage percentage."""
-        try:
-            output = subprocess.check_output("top -bn1 | grep '^%Cpu(s)' | awk '{print $2 + $4}'", shell=True).decode().strip()
-            return float(output)
-        except (subprocess.CalledProcessError, ValueError):
+        """Gets CPU usage percentage since the previous refresh."""
+        nonlocal prev_cpu_times
+        current = read_cpu_times()
+        if prev_cpu_times is None or current is None:
+            prev_cpu_times = current
+            return 0.0
+        idle_delta = current[0] - prev_cpu_times[0]
+        total_delta = current[1] - prev_cpu_times[1]
+        prev_cpu_times = current
+        if total_delta <= 0:
             return 0.0
+        return 100.0 * (1 - idle_delta / total_delta)
 
     def get_ram_usage():
-        """Gets RAM usage in GB."""
+        """Gets RAM usage in GB from /proc/meminfo."""
         try:
-            output = subprocess.check_output("free -m | awk 'NR==2{print $3}'", shell=True).decode().strip()
-            used_memory_mb = int(output)
-            return round(used_memory_mb / 1024, 2)  # GB
-        except (subprocess.CalledProcessError, ValueError):
+            meminfo = {}
+            with open("/proc/meminfo", "r") as f:
+                for line in f:
+                    key, _, rest = line.partition(":")
+                    meminfo[key] = int(rest.strip().split()[0])  # kB
+            used_kb = meminfo["MemTotal"] - meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
+            return round(used_kb / 1024 / 1024, 2)  # GB
+        except (FileNotFoundError, KeyError, ValueError, IndexError):
             return 0.0
 
     print(f"{YELLOW}\nDevice Specifications - Press 'q' to quit:{RESET}")
-    print(f"  Platform: {platform.system()} {platform.release()}")
-    print(f"  Hostname: {socket.gethostname()}")
+    print(f"  Platform: {_PLATFORM_LABEL}")
+    print(f"  Hostname: {_HOSTNAME}")
 
-    try:
-        # Get CPU information (Linux/Termux specific)
-        with open("/proc/cpuinfo", "r") as f:
-            cpu_info = f.read()
-            model_name = next((line.split(":")[1].strip() for line in cpu_info.splitlines() if "model name" in line), "N/A")
-            print(f"  CPU Model: {model_name}")
-    except FileNotFoundError:
+    # Static values were parsed from /proc once at import (Linux/Termux specific)
+    if _CPU_MODEL is not None:
+        print(f"  CPU Model: {_CPU_MODEL}")
+    else:
         print("  CPU Model: N/A (Could not retrieve CPU info)")
 
-    try:
-        # Get Total Memory information (Linux/Termux specific)
-        with open("/proc/meminfo", "r") as f:
-            mem_info = f.read()
-            total_memory_kb = next((line.split(":")[1].strip().replace(" kB", "") for line in mem_info.splitlines() if "MemTotal" in line), "0")
-            total_memory_gb = round(int(total_memory_kb) / 1024 / 1024, 2)  # Convert KB to GB
-            print(f"  Total Memory: {total_memory_gb} GB")
-    except FileNotFoundError:
+    if _TOTAL_MEMORY_GB is not None:
+        print(f"  Total Memory: {_TOTAL_MEMORY_GB} GB")
+    else:
         print("  Total Memory: N/A (Could not retrieve memory info)")
 
     print(f"  Python Version: {sys.version}")
 
-    while True:
-        cpu_usage = get_cpu_usage()
-        ram_usage = get_ram_usage()
-
-        # Create a loading bar for CPU
-        cpu_bar = "[" + "#" * int(cpu_usage / 5) + " " * (20 - int(cpu_usage / 5)) + "]"
-        print(f"{CYAN}  CPU Usage: {cpu_bar} {cpu_usage:.1f}%{RESET}", end='\r')  # Overwrite the same line
-        sys.stdout.flush()
-
-        print(f"{MAGENTA}  RAM Usage: {ram_usage:.2f} GB{RESET}", end='\r')  # Overwrite the same line
-        sys.stdout.flush()
-
-        time.sleep(0.5)  # Update every 0.5 seconds
+    # Precompute the constant parts so the hot loop only formats the numbers,
+    # and emit a single write+flush per tick (the two '\r' prints used to
+    # overwrite each other on the same line).
+    cpu_label = f"{CYAN}  CPU Usage: "
+    ram_label = f"{MAGENTA}  RAM Usage: "
+    bar_fill = "#" * 20
+    bar_blank = " " * 20
+
+    # Put the terminal in cbreak mode so a bare 'q' quits without Enter; the
+    # select timeout below then handles both key waits and refresh pacing.
+    cbreak_fd = None
+    old_termios = None
+    if termios is not None and sys.stdin.isatty():
+        cbreak_fd = sys.stdin.fileno()
+        old_termios = termios.tcgetattr(cbreak_fd)
+        tty.setcbreak(cbreak_fd)
 
-        # Check for user input 'q' to quit
-        if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:  # Check if sys.stdin has data to read
-            if sys.stdin.readline().strip().lower() == 'q':
-                print("\nReturning to Settings Menu...")
-                break  # Exit the loop
-        time.sleep(0.5)  # Give time for stdin to fill up to be read
+    try:
+        while True:
+            cpu_usage = get_cpu_usage()
+            ram_usage = get_ram_usage()
+
+            filled = int(cpu_usage / 5)
+            sys.stdout.write(f"{cpu_label}[{bar_fill[:filled]}{bar_blank[filled:]}] {cpu_usage:.1f}%{RESET}"
+                             f"{ram_label}{ram_usage:.2f} GB{RESET}\r")
+            sys.stdout.flush()
+
+            # The select timeout is the refresh pacing: wait up to 0.5 s for a
+            # keypress, then redraw. No extra sleeps needed.
+            if sys.stdin in select.select([sys.stdin], [], [], 0.5)[0]:  # Check if sys.stdin has data to read
+                if old_termios is not None:
+                    # One raw byte is all the decision needs in cbreak mode
+                    quit_pressed = os.read(cbreak_fd, 1) in (b'q', b'Q')
+                else:
+                    quit_pressed = sys.stdin.readline().strip().lower() == 'q'
+                if quit_pressed:
+                    print("\nReturning to Settings Menu...")
+                    break  # Exit the loop
+    finally:
+        if old_termios is not None:
+            termios.tcsetattr(cbreak_fd, termios.TCSADRAIN, old_termios)
 
 def display_color_theme_menu():
     """Displays the color theme menu."""
@@ -562,10 +944,12 @@ def display_color_theme_menu():
 def get_color_theme_menu_choice():
     """Gets the user's choice from the color theme menu."""
     global SETTINGS  # Access the global settings
+    # COLOR_PALETTES can gain custom themes, so rebuild once per menu entry
+    # rather than once per keypress.
+    themes = list(COLOR_PALETTES.keys())
+    display_color_theme_menu()
     while True:
-        display_color_theme_menu()
         choice = input("> ")
-        themes = list(COLOR_PALETTES.keys())
 
         if choice.isdigit():  # Only accept int, prevent errors
             choice_num = int(choice)  # Convert to int
@@ -599,7 +983,7 @@ def set_custom_theme():
             if color_code.lower() == "default":
                 color_code = COLOR_PALETTES["default"][color_name]
                 break
-            elif re.match(r"^\033\[\d+m$", color_code):  # Regex for valid ANSI code
+            elif _ANSI_RE.match(color_code):  # Regex for valid ANSI code
                 break
             else:
                 print(f"{RED}Invalid ANSI color code. Please try again or enter 'default'.{RESET}")
@@ -617,43 +1001,66 @@ def set_custom_theme():
 
 def perform_speed_test():
     """Performs a speed test using speedtest-cli and displays the results."""
-    try:
-        # Run speedtest-cli and capture the output
-        process = subprocess.Popen(["speedtest", "--simple"],
-                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = process.communicate()
-        output = stdout.decode().strip()
-
-        # Parse the output (assuming the format is consistent)
-        if output:
-            lines = output.split('\n')
-            ping = lines[0].split(': ')[1]
-            download = lines[1].split(': ')[1]
-            upload = lines[2].split(': ')[1]
-
-            # Get the external IP address
-            try:
-                external_ip = requests.get("https://api.ipify.org").text.strip()
-            except requests.exceptions.RequestException:
-                external_ip = "Could not retrieve IP address"
-
-            print(f"{GREEN}\n--- Speed Test Results ---{RESET}")
-            print(f"  Ping: {ping}")
-            print(f"  Download: {download}")
-            print(f"  Upload: {upload}")
-            print(f"  External IP: {external_ip}{RESET}\n")
+    def fetch_external_ip():
+        """Fetches the external IP address via ipify."""
+        import requests
+        try:
+            return _get_session().get("https://api.ipify.org").text.strip()
+        except requests.exceptions.RequestException:
+            return "Could not retrieve IP address"
 
-        else:
-            print(f"{RED}Speed test failed.  Check your internet connection.{RESET}")
-            if stderr:
-                print(f"{RED}Error output from speedtest-cli:\n{stderr.decode()}{RESET}")
+    # Prefer the speedtest library in-process; forking the CLI just boots a
+    # second interpreter to import the same code.
+    try:
+        import speedtest
+    except ImportError:
+        speedtest = None
 
+    try:
+        # Start the external IP lookup in the background so it overlaps with
+        # the multi-second speedtest run instead of adding to it.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            external_ip_future = executor.submit(fetch_external_ip)
+
+            if speedtest is not None:
+                st = speedtest.Speedtest(secure=True)
+                st.get_best_server()
+                ping = f"{st.results.ping:.3f} ms"
+                download = f"{st.download() / 1e6:.2f} Mbit/s"
+                upload = f"{st.upload() / 1e6:.2f} Mbit/s"
+            else:
+                # Fall back to the speedtest CLI and parse its --simple output
+                # (bounded so a stalled run can't hang the menu forever)
+                result = subprocess.run(["speedtest", "--simple"],
+                                        capture_output=True, timeout=120)
+                output = result.stdout.decode().strip()
+                if not output:
+                    print(f"{RED}Speed test failed.  Check your internet connection.{RESET}")
+                    if result.stderr:
+                        print(f"{RED}Error output from speedtest-cli:\n{result.stderr.decode()}{RESET}")
+                    return
+                lines = output.split('\n')
+                ping = lines[0].split(': ')[1]
+                download = lines[1].split(': ')[1]
+                upload = lines[2].split(': ')[1]
+
+        external_ip = external_ip_future.result()
+
+        print(f"{GREEN}\n--- Speed Test Results ---{RESET}")
+        print(f"  Ping: {ping}")
+        print(f"  Download: {download}")
+        print(f"  Upload: {upload}")
+        print(f"  External IP: {external_ip}{RESET}\n")
+
+    except subprocess.TimeoutExpired:
+        print(f"{RED}Speed test timed out. Check your internet connection.{RESET}")
     except FileNotFoundError:
         print(f"{RED}'speedtest' command not found.  Please install speedtest using: pip install speedtest-cli (or apt-get install speedtest-cli if using linux).{RESET}")
     except subprocess.CalledProcessError as e:
         print(f"{RED}Error running speedtest: {e}{RESET}")
         print(f"{RED}Command Output: {e.output.decode()}{RESET}")  # Show
     except Exception as e:
+        import traceback
         print(f"{RED}An unexpected error occurred: {e}, {traceback.format_exc()}")
 
 def display_version_info():
@@ -665,23 +1072,11 @@ def resolve_hostname():
     """Prompts the user for a hostname and attempts to resolve it to an IP address."""
     hostname = input("Enter hostname to resolve: ")
     try:
-        ip_address = socket.gethostbyname(hostname)
+        ip_address = _resolve(hostname)
         print(f"{GREEN}Hostname '{hostname}' resolves to: {ip_address}{RESET}")
     except socket.gaierror:
         print(f"{RED}Could not resolve hostname '{hostname}'.{RESET}")
 
-def analyze_http_headers(hostname):
-    """Retrieves and analyzes HTTP headers from a given hostname."""
-    try:
-        response = requests.get(f"http://{hostname}", timeout=5, allow_redirects=True)
-        headers = response.headers
-        print(f"{GREEN}\n--- HTTP Headers for {hostname} ---{RESET}")
-        for key, value in headers.items():
-            print(f"  {key}: {value}")
-        print(f"  Status Code: {response.status_code}")
-    except requests.exceptions.RequestException as e:
-        print(f"{RED}Failed to retrieve HTTP headers for {hostname}: {e}{RESET}")
-
 def main():
     """Main function to handle menu and ping operations."""
 
@@ -699,8 +1094,8 @@ def main():
                 else:
                     print(f"{RED}Ping to {server} failed.{RESET}")
 
-                # Display certificate information
-                cert = get_certificate_info(server)
+                # Display certificate information (one handshake for cert + version)
+                cert, encryption_type = get_tls_info(server)
                 if cert:
                     cert_name = get_certificate_name(cert)
                     print(f"    {GREEN}Certificate Name: {cert_name}{RESET}")
@@ -713,7 +1108,6 @@ def main():
                 else:
                     print(f"    {YELLOW}Could not retrieve certificate information.{RESET}")
 
-                encryption_type = get_encryption_type(server)
                 print(f"    {CYAN}Encryption Type: {encryption_type}{RESET}")
 
             else:
@@ -726,8 +1120,8 @@ def main():
             else:
                 print(f"{RED}Ping to {hostname} failed.{RESET}")
 
-            # Display certificate information
-            cert = get_certificate_info(hostname)
+            # Display certificate information (one handshake for cert + version)
+            cert, encryption_type = get_tls_info(hostname)
             if cert:
                 cert_name = get_certificate_name(cert)
                 print(f"    {GREEN}Certificate Name: {cert_name}{RESET}")
@@ -740,7 +1134,6 @@ def main():
             else:
                 print(f"    {YELLOW}Could not retrieve certificate information.{RESET}")
 
-            encryption_type = get_encryption_type(hostname)
             print(f"    {CYAN}Encryption Type: {encryption_type}{RESET}")
 
 
@@ -748,8 +1141,7 @@ def main():
             random_ping()
         elif choice == "4":  # List Available Servers with Status
             print(f"{MAGENTA}\nAvailable Servers with Status:{RESET}")
-            for hostname in SERVERS.values():
-                display_server_status(hostname)
+            list_servers_status()
         elif choice == "5":  # Settings
             settings_choice = get_settings_menu_choice()
             if settings_choice == "1":  # Ping Connection Tweaks
@@ -793,7 +1185,4 @@ if __name__ == "__main__":
     pip install requests
     pip install speedtest
     """
-    import select
-    import traceback
-
     main()